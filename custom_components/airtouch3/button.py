@@ -9,15 +9,12 @@ from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, MIN_TEMP, MAX_TEMP
+from .const import DOMAIN, MIN_TEMP, MAX_TEMP, OPTIMISTIC_TIMEOUT
 from .coordinator import AirTouch3Coordinator
-from .select import AirTouch3ZoneControlModeSelect
-from .sensor import AirTouch3ZoneSetpointSensor
 from .switch import get_main_device_info, get_zone_device_info
 
 LOGGER = logging.getLogger(__name__)
@@ -56,6 +53,19 @@ class AirTouch3SetpointUpButton(CoordinatorEntity[AirTouch3Coordinator], ButtonE
         """Initialize setpoint up button."""
         super().__init__(coordinator)
         self.zone_number = zone_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_zone_{zone_number}_setpoint_up"
+        self._attr_device_info = get_zone_device_info(coordinator, zone_number)
+        self._mode_key = ("zone_mode", zone_number)
+        self._setpoint_key = ("zone_setpoint", zone_number)
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the icon when an optimistic mode change expires."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.optimistic.async_add_listener(
+                self._mode_key, self.async_write_ha_state
+            )
+        )
 
     @property
     def _is_temperature_mode(self) -> bool:
@@ -69,9 +79,7 @@ class AirTouch3SetpointUpButton(CoordinatorEntity[AirTouch3Coordinator], ButtonE
             return False
 
         # Check for optimistic mode from control mode select
-        optimistic_mode = AirTouch3ZoneControlModeSelect.get_optimistic_mode(
-            self.coordinator.data.device_id, self.zone_number
-        )
+        optimistic_mode = self.coordinator.optimistic.get(self._mode_key)
         if optimistic_mode is not None:
             return optimistic_mode
 
@@ -86,10 +94,9 @@ class AirTouch3SetpointUpButton(CoordinatorEntity[AirTouch3Coordinator], ButtonE
         """Handle button press - increase setpoint."""
         LOGGER.debug("Setpoint UP pressed for zone %d", self.zone_number)
         zone = self.coordinator.data.zones[self.zone_number]
-        device_id = self.coordinator.data.device_id
 
         # Get current value - use optimistic if set (for rapid presses), otherwise actual
-        optimistic = AirTouch3ZoneSetpointSensor.get_optimistic_value(device_id, self.zone_number)
+        optimistic = self.coordinator.optimistic.get(self._setpoint_key)
         
         if self._is_temperature_mode:
             current = optimistic if optimistic is not None else zone.setpoint
@@ -104,25 +111,17 @@ class AirTouch3SetpointUpButton(CoordinatorEntity[AirTouch3Coordinator], ButtonE
                 return
             new_value = min(current + 5, 100)
 
-        # Set optimistic value immediately (with 'up' direction for clearing logic)
-        AirTouch3ZoneSetpointSensor.set_optimistic_value(
-            device_id, self.zone_number, new_value, 'up'
+        # Set optimistic value immediately (with 'up' direction for clearing logic).
+        # Stored even without a setpoint sensor so rapid presses respect the limits;
+        # on expiry the zone's setpoint sensor falls back via its key listener
+        self.coordinator.optimistic.set(
+            self._setpoint_key, new_value, OPTIMISTIC_TIMEOUT, direction='up'
         )
         self.coordinator.async_set_updated_data(self.coordinator.data)
 
         await self.coordinator.client.zone_value_up(self.zone_number)
         await self.coordinator.async_request_refresh()
 
-    @property
-    def unique_id(self) -> str:
-        """Unique ID for setpoint up button."""
-        return f"{self.coordinator.data.device_id}_zone_{self.zone_number}_setpoint_up"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - zone sub-device."""
-        return get_zone_device_info(self.coordinator, self.zone_number)
-
 
 class AirTouch3SetpointDownButton(CoordinatorEntity[AirTouch3Coordinator], ButtonEntity):
     """Button to decrease zone setpoint.
@@ -138,6 +137,19 @@ class AirTouch3SetpointDownButton(CoordinatorEntity[AirTouch3Coordinator], Butto
         """Initialize setpoint down button."""
         super().__init__(coordinator)
         self.zone_number = zone_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_zone_{zone_number}_setpoint_down"
+        self._attr_device_info = get_zone_device_info(coordinator, zone_number)
+        self._mode_key = ("zone_mode", zone_number)
+        self._setpoint_key = ("zone_setpoint", zone_number)
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the icon when an optimistic mode change expires."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.optimistic.async_add_listener(
+                self._mode_key, self.async_write_ha_state
+            )
+        )
 
     @property
     def _is_temperature_mode(self) -> bool:
@@ -151,9 +163,7 @@ class AirTouch3SetpointDownButton(CoordinatorEntity[AirTouch3Coordinator], Butto
             return False
 
         # Check for optimistic mode from control mode select
-        optimistic_mode = AirTouch3ZoneControlModeSelect.get_optimistic_mode(
-            self.coordinator.data.device_id, self.zone_number
-        )
+        optimistic_mode = self.coordinator.optimistic.get(self._mode_key)
         if optimistic_mode is not None:
             return optimistic_mode
 
@@ -168,10 +178,9 @@ class AirTouch3SetpointDownButton(CoordinatorEntity[AirTouch3Coordinator], Butto
         """Handle button press - decrease setpoint."""
         LOGGER.debug("Setpoint DOWN pressed for zone %d", self.zone_number)
         zone = self.coordinator.data.zones[self.zone_number]
-        device_id = self.coordinator.data.device_id
 
         # Get current value - use optimistic if set (for rapid presses), otherwise actual
-        optimistic = AirTouch3ZoneSetpointSensor.get_optimistic_value(device_id, self.zone_number)
+        optimistic = self.coordinator.optimistic.get(self._setpoint_key)
         
         if self._is_temperature_mode:
             current = optimistic if optimistic is not None else zone.setpoint
@@ -186,25 +195,17 @@ class AirTouch3SetpointDownButton(CoordinatorEntity[AirTouch3Coordinator], Butto
                 return
             new_value = max(current - 5, 0)
 
-        # Set optimistic value immediately (with 'down' direction for clearing logic)
-        AirTouch3ZoneSetpointSensor.set_optimistic_value(
-            device_id, self.zone_number, new_value, 'down'
+        # Set optimistic value immediately (with 'down' direction for clearing logic).
+        # Stored even without a setpoint sensor so rapid presses respect the limits;
+        # on expiry the zone's setpoint sensor falls back via its key listener
+        self.coordinator.optimistic.set(
+            self._setpoint_key, new_value, OPTIMISTIC_TIMEOUT, direction='down'
         )
         self.coordinator.async_set_updated_data(self.coordinator.data)
 
         await self.coordinator.client.zone_value_down(self.zone_number)
         await self.coordinator.async_request_refresh()
 
-    @property
-    def unique_id(self) -> str:
-        """Unique ID for setpoint down button."""
-        return f"{self.coordinator.data.device_id}_zone_{self.zone_number}_setpoint_down"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - zone sub-device."""
-        return get_zone_device_info(self.coordinator, self.zone_number)
-
 
 class AirTouch3SyncTimeButton(CoordinatorEntity[AirTouch3Coordinator], ButtonEntity):
     """Button to push local time to the AirTouch 3 unit."""
@@ -217,6 +218,9 @@ class AirTouch3SyncTimeButton(CoordinatorEntity[AirTouch3Coordinator], ButtonEnt
     def __init__(self, coordinator: AirTouch3Coordinator) -> None:
         """Initialize sync time button."""
         super().__init__(coordinator)
+        self._device_id = coordinator.data.device_id
+        self._attr_unique_id = f"{self._device_id}_sync_time"
+        self._attr_device_info = get_main_device_info(coordinator)
 
     async def async_press(self) -> None:
         """Handle button press - send time sync command."""
@@ -224,7 +228,7 @@ class AirTouch3SyncTimeButton(CoordinatorEntity[AirTouch3Coordinator], ButtonEnt
         LOGGER.debug("Sync Time pressed, sending %s", now.isoformat())
 
         if await self.coordinator.client.sync_time(now):
-            notification_id = f"{self.coordinator.data.device_id}_time_sync"
+            notification_id = f"{self._device_id}_time_sync"
             persistent_notification.async_create(
                 self.hass,
                 "Time Updated",
@@ -234,19 +238,9 @@ class AirTouch3SyncTimeButton(CoordinatorEntity[AirTouch3Coordinator], ButtonEnt
             self.hass.bus.async_fire(
                 "airtouch3_time_synced",
                 {
-                    "device_id": self.coordinator.data.device_id,
+                    "device_id": self._device_id,
                     "time": now.isoformat(),
                 },
             )
         else:
-            LOGGER.error("Failed to sync time for AirTouch 3 device %s", self.coordinator.data.device_id)
-
-    @property
-    def unique_id(self) -> str:
-        """Unique ID for sync time button."""
-        return f"{self.coordinator.data.device_id}_sync_time"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - main device."""
-        return get_main_device_info(self.coordinator)
+            LOGGER.error("Failed to sync time for AirTouch 3 device %s", self._device_id)
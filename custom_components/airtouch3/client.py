@@ -551,7 +551,7 @@ class AirTouch3Client:
 
             setpoint = data[const.OFFSET_AC_SETPOINT + ac_num] & 0x7F
             room_temp_raw = data[const.OFFSET_AC_ROOM_TEMP + ac_num]
-            room_temp = room_temp_raw - 256 if room_temp_raw > 127 else room_temp_raw
+            room_temp = float(room_temp_raw - 256 if room_temp_raw > 127 else room_temp_raw)
 
             error_low = data[const.OFFSET_AC_ERROR + (ac_num * 2)]
             error_high = data[const.OFFSET_AC_ERROR + (ac_num * 2) + 1]
@@ -663,17 +663,19 @@ class AirTouch3Client:
             has_sensor = has_touchpad or has_wireless_sensor1 or has_wireless_sensor2
 
             # Log when using cached sensor presence for debugging
-            used_cache1 = has_wireless_sensor1 and not sensor1_available_now
-            used_cache2 = has_wireless_sensor2 and not sensor2_available_now
-            if used_cache1 or used_cache2:
+            # (runs for every zone on every poll, so skip the work unless enabled)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                used_cache1 = has_wireless_sensor1 and not sensor1_available_now
+                used_cache2 = has_wireless_sensor2 and not sensor2_available_now
+                if used_cache1 or used_cache2:
+                    LOGGER.debug(
+                        "Zone %d (%s): using cached sensor presence (slot1=%s, slot2=%s)",
+                        zone_num, name, used_cache1, used_cache2
+                    )
                 LOGGER.debug(
-                    "Zone %d (%s): using cached sensor presence (slot1=%s, slot2=%s)",
-                    zone_num, name, used_cache1, used_cache2
+                    "Zone %d (%s): has_touchpad=%s, has_wireless1=%s, has_wireless2=%s, has_sensor=%s",
+                    zone_num, name, has_touchpad, has_wireless_sensor1, has_wireless_sensor2, has_sensor
                 )
-            LOGGER.debug(
-                "Zone %d (%s): has_touchpad=%s, has_wireless1=%s, has_wireless2=%s, has_sensor=%s",
-                zone_num, name, has_touchpad, has_wireless_sensor1, has_wireless_sensor2, has_sensor
-            )
 
             zones.append(
                 ZoneState(
@@ -701,7 +703,7 @@ class AirTouch3Client:
                 TouchpadState(
                     touchpad_number=tp_index + 1,
                     assigned_zone=assigned_zone,
-                    temperature=temp_value if temp_value > 0 else None,
+                    temperature=float(temp_value) if temp_value > 0 else None,
                 )
             )
 
@@ -711,7 +713,7 @@ class AirTouch3Client:
             # Bit 7 = available, bit 6 = low battery, bits 0-5 = temperature
             available = bool(raw & 0x80)
             low_battery = bool(raw & 0x40)
-            temperature = raw & 0x3F
+            temperature = float(raw & 0x3F)
             sensors.append(
                 SensorState(
                     sensor_number=sensor_index + 1,
@@ -721,6 +723,14 @@ class AirTouch3Client:
                 )
             )
 
+        # Only touchpads with a reading can supply a zone temperature. Iterate in
+        # reverse so touchpad 1 wins when both are assigned to the same zone.
+        touchpad_by_zone = {
+            tp.assigned_zone: tp
+            for tp in reversed(touchpads)
+            if tp.assigned_zone >= 0 and tp.temperature
+        }
+
         return SystemState(
             raw_data=data,
             device_id=device_id,
@@ -731,6 +741,7 @@ class AirTouch3Client:
             zones=zones,
             sensors=sensors,
             touchpads=touchpads,
+            touchpad_by_zone=touchpad_by_zone,
         )
 
     def _encode_mode(self, mode: AcMode, brand: int) -> int:
@@ -71,6 +71,13 @@ class AirTouch3Climate(CoordinatorEntity[AirTouch3Coordinator], ClimateEntity):
         """Initialize entity."""
         super().__init__(coordinator)
         self.ac_number = ac_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_ac_{ac_number}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.data.device_id)},
+            name=coordinator.data.system_name,
+            manufacturer="Polyaire",
+            model="AirTouch 3",
+        )
         self._attr_name = coordinator.data.ac_units[ac_number].name
         self._optimistic_power: bool | None = None
         self._optimistic_mode: AcMode | None = None
@@ -153,7 +160,7 @@ class AirTouch3Climate(CoordinatorEntity[AirTouch3Coordinator], ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return current temperature."""
-        return float(self._ac_state.room_temp)
+        return self._ac_state.room_temp
 
     @property
     def target_temperature(self) -> float | None:
@@ -255,21 +262,6 @@ class AirTouch3Climate(CoordinatorEntity[AirTouch3Coordinator], ClimateEntity):
             await self.coordinator.client.ac_power_toggle(self.ac_number)
             await self.coordinator.async_request_refresh()
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for entity."""
-        return f"{self.coordinator.data.device_id}_ac_{self.ac_number}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for registry."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.data.device_id)},
-            name=self.coordinator.data.system_name,
-            manufacturer="Polyaire",
-            model="AirTouch 3",
-        )
-
     def _hvac_to_ac_mode(self, hvac_mode: HVACMode) -> AcMode:
         """Map HA HVAC mode to protocol mode."""
         mapping = {
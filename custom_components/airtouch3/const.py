@@ -13,6 +13,15 @@ CONNECT_TIMEOUT = 5.0
 READ_TIMEOUT = 1.0
 MIN_SCAN_INTERVAL = 10
 MAX_SCAN_INTERVAL = 300
+# Cooldown for async_request_refresh(): the poll runs this long after the
+# first request, giving the unit time to apply a command, and any requests
+# made meanwhile share that single poll.
+REQUEST_REFRESH_COOLDOWN = 2.0
+# How long to hold optimistic setpoint values before falling back to actual (seconds)
+# This should be long enough that pauses between button presses don't cause
+# the value to "jump", but short enough to self-correct if truly out of sync.
+# Using 30s to match the default coordinator refresh interval.
+OPTIMISTIC_TIMEOUT = 30.0
 
 # Configuration keys
 CONF_INCLUDE_SENSORS = "include_sensors"
@@ -3,20 +3,100 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Hashable
 from datetime import timedelta
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .client import AirTouch3Client
-from .const import DEFAULT_SCAN_INTERVAL
+from .const import DEFAULT_SCAN_INTERVAL, REQUEST_REFRESH_COOLDOWN
 from .models import SystemState
 
 LOGGER = logging.getLogger(__name__)
 
 
+class OptimisticManager:
+    """Optimistic values for all entities of one coordinator.
+
+    Each key holds a value until it is cleared or its timeout fires. The
+    timeout is a single loop timer per key, so reads are a dict lookup with
+    no clock comparison.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the manager."""
+        self._loop = loop
+        # key -> (value, direction, expiry timer)
+        self._entries: dict[Hashable, tuple[Any, str | None, asyncio.TimerHandle]] = {}
+        # key -> callbacks run when that key's value expires
+        self._listeners: dict[Hashable, list[Callable[[], None]]] = {}
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        timeout: float,
+        on_expire: Callable[[], None] | None = None,
+        direction: str | None = None,
+    ) -> None:
+        """Hold value for key, replacing any pending value and timer."""
+        self.clear(key)
+        timer = self._loop.call_later(timeout, self._expire, key, on_expire)
+        self._entries[key] = (value, direction, timer)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the held value for key, or None."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def direction(self, key: Hashable) -> str | None:
+        """Return the direction stored with the value for key, or None."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def clear(self, key: Hashable) -> None:
+        """Drop the value for key and cancel its timer."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry[2].cancel()
+
+    def async_add_listener(
+        self, key: Hashable, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call update_callback when the value for key expires.
+
+        Lets only the entities that read a key refresh on its expiry, instead
+        of updating every coordinator listener. Returns a remove function.
+        """
+        listeners = self._listeners.setdefault(key, [])
+        listeners.append(update_callback)
+
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    def clear_all(self) -> None:
+        """Drop all values and cancel all timers."""
+        for _value, _direction, timer in self._entries.values():
+            timer.cancel()
+        self._entries.clear()
+
+    def _expire(self, key: Hashable, on_expire: Callable[[], None] | None) -> None:
+        """Drop an expired value and notify its owner."""
+        self._entries.pop(key, None)
+        if on_expire is not None:
+            on_expire()
+        for update_callback in tuple(self._listeners.get(key, ())):
+            update_callback()
+
+
 class AirTouch3Coordinator(DataUpdateCoordinator[SystemState]):
     """Coordinator managing connection and state polling."""
 
@@ -35,8 +115,20 @@ class AirTouch3Coordinator(DataUpdateCoordinator[SystemState]):
             name=name,
             config_entry=config_entry,
             update_interval=update_interval or timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Entities call async_request_refresh() right after sending a command.
+            # Don't poll immediately: wait for the unit to apply it, and fold
+            # bursts of commands (rapid toggles, scripts) into one poll.
+            request_refresh_debouncer=Debouncer(
+                hass, LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.client = client
+        # Optimistic state for switches, selects and setpoints, keyed by
+        # (kind, number) tuples such as ("zone_mode", 2)
+        self.optimistic = OptimisticManager(hass.loop)
+        # DeviceInfo shared by all entities of a device (see switch.get_*_device_info)
+        self.main_device_info: DeviceInfo | None = None
+        self.zone_device_info: dict[int, DeviceInfo] = {}
 
     async def _async_setup(self) -> None:
         """Run once before first refresh to establish connection."""
@@ -63,4 +155,7 @@ class AirTouch3Coordinator(DataUpdateCoordinator[SystemState]):
 
     async def async_shutdown(self) -> None:
         """Close TCP connection on unload."""
+        # Base shutdown cancels the pending debounced refresh and poll timer
+        await super().async_shutdown()
+        self.optimistic.clear_all()
         await self.client.disconnect()
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class AcMode(IntEnum):
@@ -38,7 +38,7 @@ class AcState:
     mode: AcMode
     fan_speed: FanSpeed
     setpoint: int
-    room_temp: int
+    room_temp: float
     brand_id: int
     has_error: bool
     error_code: int
@@ -70,7 +70,7 @@ class SensorState:
     sensor_number: int
     available: bool
     low_battery: bool
-    temperature: int
+    temperature: float
 
 
 @dataclass
@@ -79,7 +79,7 @@ class TouchpadState:
 
     touchpad_number: int
     assigned_zone: int
-    temperature: Optional[int]
+    temperature: Optional[float]
 
 
 @dataclass
@@ -95,3 +95,5 @@ class SystemState:
     zones: List[ZoneState]
     sensors: List[SensorState]
     touchpads: List[TouchpadState]
+    # Zone number -> touchpad supplying its temperature (first touchpad wins)
+    touchpad_by_zone: Dict[int, TouchpadState] = field(default_factory=dict)
@@ -8,7 +8,6 @@ from typing import Any
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -74,6 +73,8 @@ class AirTouch3AcModeSelect(CoordinatorEntity[AirTouch3Coordinator], SelectEntit
         """Initialize AC mode select."""
         super().__init__(coordinator)
         self.ac_number = ac_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_ac_{ac_number}_mode"
+        self._attr_device_info = get_main_device_info(coordinator)
         ac_name = coordinator.data.ac_units[ac_number].name
         self._attr_name = f"{ac_name} Mode"
         self._attr_options = list(MODE_TO_STR.values())
@@ -113,16 +114,6 @@ class AirTouch3AcModeSelect(CoordinatorEntity[AirTouch3Coordinator], SelectEntit
         await self.coordinator.client.ac_set_mode(self.ac_number, mode)
         await self.coordinator.async_request_refresh()
 
-    @property
-    def unique_id(self) -> str:
-        """Unique ID for AC mode select."""
-        return f"{self.coordinator.data.device_id}_ac_{self.ac_number}_mode"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - main device."""
-        return get_main_device_info(self.coordinator)
-
 
 class AirTouch3AcFanSelect(CoordinatorEntity[AirTouch3Coordinator], SelectEntity):
     """Select entity for AC fan speed."""
@@ -133,6 +124,8 @@ class AirTouch3AcFanSelect(CoordinatorEntity[AirTouch3Coordinator], SelectEntity
         """Initialize AC fan select."""
         super().__init__(coordinator)
         self.ac_number = ac_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_ac_{ac_number}_fan"
+        self._attr_device_info = get_main_device_info(coordinator)
         ac_name = coordinator.data.ac_units[ac_number].name
         self._attr_name = f"{ac_name} Fan Speed"
         self._optimistic_fan: FanSpeed | None = None
@@ -176,16 +169,6 @@ class AirTouch3AcFanSelect(CoordinatorEntity[AirTouch3Coordinator], SelectEntity
         await self.coordinator.client.ac_set_fan_speed(self.ac_number, speed)
         await self.coordinator.async_request_refresh()
 
-    @property
-    def unique_id(self) -> str:
-        """Unique ID for AC fan select."""
-        return f"{self.coordinator.data.device_id}_ac_{self.ac_number}_fan"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - main device."""
-        return get_main_device_info(self.coordinator)
-
 
 class AirTouch3ZoneControlModeSelect(CoordinatorEntity[AirTouch3Coordinator], SelectEntity):
     """Select entity for zone control mode (Temperature or Fan/%).
@@ -199,14 +182,12 @@ class AirTouch3ZoneControlModeSelect(CoordinatorEntity[AirTouch3Coordinator], Se
     _attr_has_entity_name = True
     _attr_name = "Control Mode"
 
-    # Class-level registry for optimistic mode values, shared with setpoint sensor.
-    # Maps (device_id, zone_number) -> (is_temp_mode, timestamp)
-    _optimistic_modes: dict[tuple[str, int], tuple[bool, float]] = {}
-
     def __init__(self, coordinator: AirTouch3Coordinator, zone_number: int) -> None:
         """Initialize zone control mode select."""
         super().__init__(coordinator)
         self.zone_number = zone_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_zone_{zone_number}_control_mode"
+        self._attr_device_info = get_zone_device_info(coordinator, zone_number)
         self._attr_options = ZONE_CONTROL_MODE_OPTIONS
         
         # Disable entity by default if zone doesn't have a sensor at startup.
@@ -217,33 +198,24 @@ class AirTouch3ZoneControlModeSelect(CoordinatorEntity[AirTouch3Coordinator], Se
         if not zone.has_sensor:
             self._attr_entity_registry_enabled_default = False
 
-    @classmethod
-    def set_optimistic_mode(cls, device_id: str, zone_number: int, is_temp_mode: bool) -> None:
-        """Set an optimistic mode value (shared with setpoint sensor)."""
-        cls._optimistic_modes[(device_id, zone_number)] = (is_temp_mode, time.monotonic())
-
-    @classmethod
-    def clear_optimistic_mode(cls, device_id: str, zone_number: int) -> None:
-        """Clear the optimistic mode value."""
-        cls._optimistic_modes.pop((device_id, zone_number), None)
-
-    @classmethod
-    def get_optimistic_mode(cls, device_id: str, zone_number: int) -> bool | None:
-        """Get the current optimistic mode if set and not expired."""
-        entry = cls._optimistic_modes.get((device_id, zone_number))
-        if entry is None:
-            return None
-        is_temp_mode, timestamp = entry
-        # Check if expired (use same timeout as other optimistic values)
-        if time.monotonic() - timestamp > OPTIMISTIC_HOLD_SECONDS:
-            cls._optimistic_modes.pop((device_id, zone_number), None)
-            return None
-        return is_temp_mode
-
-    @property
-    def _optimistic_key(self) -> tuple[str, int]:
-        """Get the key for optimistic mode lookup."""
-        return (self.coordinator.data.device_id, self.zone_number)
+        # Resolved mode (optimistic or actual), shared by current_option and icon
+        self._is_temp_mode = zone.temperature_control
+        # Optimistic mode key, also read by the setpoint sensor and buttons
+        self._optimistic_key = ("zone_mode", zone_number)
+
+    async def async_added_to_hass(self) -> None:
+        """Fall back to the actual mode when the optimistic mode expires."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.optimistic.async_add_listener(
+                self._optimistic_key, self._handle_coordinator_update
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any optimistic mode on removal."""
+        self.coordinator.optimistic.clear(self._optimistic_key)
+        await super().async_will_remove_from_hass()
 
     @property
     def available(self) -> bool:
@@ -253,29 +225,25 @@ class AirTouch3ZoneControlModeSelect(CoordinatorEntity[AirTouch3Coordinator], Se
     @property
     def current_option(self) -> str | None:
         """Return current control mode."""
-        # Check optimistic state first
-        optimistic = self.get_optimistic_mode(*self._optimistic_key)
-        if optimistic is not None:
-            return ZONE_CONTROL_MODE_TEMPERATURE if optimistic else ZONE_CONTROL_MODE_FAN
-        # Get actual state from coordinator
-        is_temp_mode = self.coordinator.data.zones[self.zone_number].temperature_control
-        return ZONE_CONTROL_MODE_TEMPERATURE if is_temp_mode else ZONE_CONTROL_MODE_FAN
+        return ZONE_CONTROL_MODE_TEMPERATURE if self._is_temp_mode else ZONE_CONTROL_MODE_FAN
 
     @property
     def icon(self) -> str:
         """Return icon based on current mode."""
-        current = self.current_option
-        return "mdi:thermometer" if current == ZONE_CONTROL_MODE_TEMPERATURE else "mdi:fan"
+        return "mdi:thermometer" if self._is_temp_mode else "mdi:fan"
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from coordinator."""
-        optimistic = self.get_optimistic_mode(*self._optimistic_key)
-        if optimistic is not None:
-            actual_mode = self.coordinator.data.zones[self.zone_number].temperature_control
-            if actual_mode == optimistic:
-                # Actual state matches expected, clear optimistic state
-                self.clear_optimistic_mode(*self._optimistic_key)
+        actual_mode = self.coordinator.data.zones[self.zone_number].temperature_control
+        # Check optimistic state first
+        optimistic = self.coordinator.optimistic.get(self._optimistic_key)
+        if optimistic is not None and actual_mode != optimistic:
+            self._is_temp_mode = optimistic
+        else:
+            # Actual state matches expected (or no optimistic), clear optimistic state
+            self.coordinator.optimistic.clear(self._optimistic_key)
+            self._is_temp_mode = actual_mode
         super()._handle_coordinator_update()
 
     async def async_select_option(self, option: str) -> None:
@@ -285,19 +253,14 @@ class AirTouch3ZoneControlModeSelect(CoordinatorEntity[AirTouch3Coordinator], Se
 
         # Only send toggle if we need to change the mode
         if target_is_temp != current_is_temp:
-            self.set_optimistic_mode(*self._optimistic_key, target_is_temp)
+            # On expiry, this zone's select, setpoint sensor and setpoint
+            # buttons fall back to the actual mode via their key listeners
+            self.coordinator.optimistic.set(
+                self._optimistic_key, target_is_temp, OPTIMISTIC_HOLD_SECONDS
+            )
+            self._is_temp_mode = target_is_temp
             # Trigger update for this entity and the setpoint sensor
             self.async_write_ha_state()
             self.coordinator.async_set_updated_data(self.coordinator.data)
             await self.coordinator.client.zone_toggle_mode(self.zone_number)
             await self.coordinator.async_request_refresh()
-
-    @property
-    def unique_id(self) -> str:
-        """Unique ID for zone control mode select."""
-        return f"{self.coordinator.data.device_id}_zone_{self.zone_number}_control_mode"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - zone sub-device."""
-        return get_zone_device_info(self.coordinator, self.zone_number)
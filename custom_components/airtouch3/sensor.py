@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,24 +11,20 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import AirTouch3Coordinator
-from .select import AirTouch3ZoneControlModeSelect
+from .models import SensorState, TouchpadState, ZoneState
 from .switch import get_zone_device_info, get_main_device_info
 
 LOGGER = logging.getLogger(__name__)
 
-# How long to hold optimistic values before falling back to actual (seconds)
-# This should be long enough that pauses between button presses don't cause
-# the value to "jump", but short enough to self-correct if truly out of sync.
-# Using 30s to match the default coordinator refresh interval.
-OPTIMISTIC_TIMEOUT = 30.0
+# Shared attributes for zones with no temperature source (never mutated)
+_EMPTY_ATTRS: dict[str, Any] = {}
 
 
 async def async_setup_entry(
@@ -65,23 +60,17 @@ class AirTouch3AcTemperatureSensor(CoordinatorEntity[AirTouch3Coordinator], Sens
         """Initialize AC temperature sensor."""
         super().__init__(coordinator)
         self.ac_number = ac_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_ac_{ac_number}_temperature"
+        self._attr_device_info = get_main_device_info(coordinator)
         name = coordinator.data.ac_units[ac_number].name
         self._attr_name = f"{name} Temperature"
+        self._attr_native_value = coordinator.data.ac_units[ac_number].room_temp
 
-    @property
-    def native_value(self) -> float | None:
-        """Return temperature value."""
-        return float(self.coordinator.data.ac_units[self.ac_number].room_temp)
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self.coordinator.data.device_id}_ac_{self.ac_number}_temperature"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - main device."""
-        return get_main_device_info(self.coordinator)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the temperature once per update rather than reading it on every write."""
+        self._attr_native_value = self.coordinator.data.ac_units[self.ac_number].room_temp
+        super()._handle_coordinator_update()
 
 
 class AirTouch3ZoneTemperatureSensor(CoordinatorEntity[AirTouch3Coordinator], SensorEntity):
@@ -101,82 +90,90 @@ class AirTouch3ZoneTemperatureSensor(CoordinatorEntity[AirTouch3Coordinator], Se
         """Initialize zone temperature sensor."""
         super().__init__(coordinator)
         self.zone_number = zone_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_zone_{zone_number}_temperature"
+        self._attr_device_info = get_zone_device_info(coordinator, zone_number)
+        # Wireless sensor slots for this zone (zone_number * 2 and zone_number * 2 + 1).
+        # The parser always emits the same number of slots, so bounds are checked once.
+        self._sensor1_index = zone_number * 2
+        self._sensor2_index = zone_number * 2 + 1
+        sensor_count = len(coordinator.data.sensors)
+        self._has_s1 = self._sensor1_index < sensor_count
+        self._has_s2 = self._sensor2_index < sensor_count
+        # Source names in priority order, indexed by the slot _find_source returns
+        self._source_names = (
+            "touchpad1",
+            "touchpad2",
+            f"wireless_{self._sensor1_index + 1}",
+            f"wireless_{self._sensor2_index + 1}",
+        )
+        self._update_from_source()
 
-    def _get_temperature_and_source(self) -> tuple[int | None, str | None, bool]:
-        """Get temperature value, source name, and low battery flag.
+    def _find_source(self) -> tuple[int, TouchpadState | SensorState] | None:
+        """Find the reading currently providing this zone's temperature.
 
-        Returns (temperature, source, low_battery).
+        Returns (slot, reading) where slot indexes self._source_names.
         Follows app logic: touchpad priority, then sensor1, then sensor2.
         """
         data = self.coordinator.data
-        zone = data.zones[self.zone_number]
+        zone_number = self.zone_number
 
-        # Check touchpad 1 (assigned_zone is 0-indexed, -1 means unassigned)
-        tp1 = data.touchpads[0]
-        if tp1.assigned_zone == self.zone_number and tp1.temperature is not None and tp1.temperature > 0:
-            return tp1.temperature, "touchpad1", False
-
-        # Check touchpad 2
-        tp2 = data.touchpads[1]
-        if tp2.assigned_zone == self.zone_number and tp2.temperature is not None and tp2.temperature > 0:
-            return tp2.temperature, "touchpad2", False
+        # Touchpad assigned to this zone takes priority (touchpad 1 before 2)
+        touchpad = data.touchpad_by_zone.get(zone_number)
+        if touchpad is not None:
+            return touchpad.touchpad_number - 1, touchpad
 
         # For wireless sensors, use zone.has_sensor (sticky detection) to determine
         # if we should return the temperature. The sensor's "available" bit flickers
         # based on transmission timing, but the temperature value is still valid.
-        if not zone.has_sensor:
-            return None, None, False
+        if not data.zones[zone_number].has_sensor:
+            return None
 
         # Check wireless sensor 1 for this zone (slot = zone_number * 2)
-        sensor1_index = self.zone_number * 2
-        if sensor1_index < len(data.sensors):
-            sensor1 = data.sensors[sensor1_index]
+        if self._has_s1:
+            sensor1 = data.sensors[self._sensor1_index]
             # Return temperature if sensor has ever been detected (via has_sensor)
             # and has a valid temperature reading (> 0)
             if sensor1.temperature > 0:
-                return sensor1.temperature, f"wireless_{sensor1_index + 1}", sensor1.low_battery
+                return 2, sensor1
 
         # Check wireless sensor 2 for this zone (slot = zone_number * 2 + 1)
-        sensor2_index = self.zone_number * 2 + 1
-        if sensor2_index < len(data.sensors):
-            sensor2 = data.sensors[sensor2_index]
+        if self._has_s2:
+            sensor2 = data.sensors[self._sensor2_index]
             if sensor2.temperature > 0:
-                return sensor2.temperature, f"wireless_{sensor2_index + 1}", sensor2.low_battery
-
-        return None, None, False
+                return 3, sensor2
+
+        return None
+
+    def _update_from_source(self) -> None:
+        """Resolve the active source once and cache value, availability and attributes."""
+        found = self._find_source()
+        if found is None:
+            self._attr_native_value = None
+            self._attr_available = False
+            self._attr_extra_state_attributes = _EMPTY_ATTRS
+            return
+
+        slot, reading = found
+        self._attr_native_value = reading.temperature
+        self._attr_available = True
+        attrs: dict[str, Any] = {"source": self._source_names[slot]}
+        if isinstance(reading, SensorState) and reading.low_battery:
+            attrs["low_battery"] = True
+        self._attr_extra_state_attributes = attrs
 
-    @property
-    def native_value(self) -> float | None:
-        """Return temperature value."""
-        temp, _, _ = self._get_temperature_and_source()
-        return float(temp) if temp is not None else None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from coordinator."""
+        self._update_from_source()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
-        """Return True if any temperature source is available."""
-        temp, _, _ = self._get_temperature_and_source()
-        return temp is not None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes including source and battery status."""
-        temp, source, low_battery = self._get_temperature_and_source()
-        attrs: dict[str, Any] = {}
-        if source:
-            attrs["source"] = source
-        if low_battery:
-            attrs["low_battery"] = True
-        return attrs
+        """Return True if any temperature source is available.
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self.coordinator.data.device_id}_zone_{self.zone_number}_temperature"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - zone sub-device."""
-        return get_zone_device_info(self.coordinator, self.zone_number)
+        CoordinatorEntity.available ignores _attr_available, so expose it here.
+        """
+        return self._attr_available
 
 
 class AirTouch3DamperSensor(CoordinatorEntity[AirTouch3Coordinator], SensorEntity):
@@ -191,21 +188,15 @@ class AirTouch3DamperSensor(CoordinatorEntity[AirTouch3Coordinator], SensorEntit
         """Initialize damper sensor."""
         super().__init__(coordinator)
         self.zone_number = zone_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_zone_{zone_number}_damper"
+        self._attr_device_info = get_zone_device_info(coordinator, zone_number)
+        self._attr_native_value = float(coordinator.data.zones[zone_number].damper_percent)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return damper opening percentage."""
-        return float(self.coordinator.data.zones[self.zone_number].damper_percent)
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self.coordinator.data.device_id}_zone_{self.zone_number}_damper"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - zone sub-device."""
-        return get_zone_device_info(self.coordinator, self.zone_number)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Convert the damper percentage once per update rather than on every read."""
+        self._attr_native_value = float(self.coordinator.data.zones[self.zone_number].damper_percent)
+        super()._handle_coordinator_update()
 
 
 class AirTouch3ZoneSetpointSensor(CoordinatorEntity[AirTouch3Coordinator], SensorEntity):
@@ -220,75 +211,88 @@ class AirTouch3ZoneSetpointSensor(CoordinatorEntity[AirTouch3Coordinator], Senso
     _attr_has_entity_name = True
     _attr_name = "Setpoint"
 
-    # Class-level registry for optimistic setpoint values
-    # Maps (device_id, zone_number) -> (optimistic_value, direction, timestamp)
-    # direction: 'up' or 'down' to know how to compare for clearing
-    # timestamp: when the optimistic value was set (for timeout fallback)
-    _optimistic_values: dict[tuple[str, int], tuple[int, str, float]] = {}
-
     def __init__(self, coordinator: AirTouch3Coordinator, zone_number: int) -> None:
         """Initialize setpoint sensor."""
         super().__init__(coordinator)
         self.zone_number = zone_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_zone_{zone_number}_setpoint"
+        self._attr_device_info = get_zone_device_info(coordinator, zone_number)
+        # Optimistic setpoint state is set by the buttons in the coordinator's
+        # OptimisticManager with direction 'up' or 'down' to know how to compare
+        # for clearing. Its timer clears the value after OPTIMISTIC_TIMEOUT.
+        self._optimistic_key = ("zone_setpoint", zone_number)
+        self._mode_key = ("zone_mode", zone_number)
+        # Zone and mode feed native_value, device_class, unit and icon, so
+        # resolve them once per coordinator update and cache the results
+        self._cached_zone = coordinator.data.zones[zone_number]
+        self._is_temperature_mode = self._read_temperature_mode(self._cached_zone)
+        self._update_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Fall back to actual values when optimistic setpoint or mode expires."""
+        await super().async_added_to_hass()
+        optimistic = self.coordinator.optimistic
+        self.async_on_remove(
+            optimistic.async_add_listener(self._optimistic_key, self._async_expire_optimistic)
+        )
+        self.async_on_remove(
+            optimistic.async_add_listener(self._mode_key, self._handle_coordinator_update)
+        )
 
-    @classmethod
-    def set_optimistic_value(cls, device_id: str, zone_number: int, value: int, direction: str = 'up') -> None:
-        """Set an optimistic setpoint value (called by buttons)."""
-        cls._optimistic_values[(device_id, zone_number)] = (value, direction, time.monotonic())
-
-    @classmethod
-    def clear_optimistic_value(cls, device_id: str, zone_number: int) -> None:
+    @callback
+    def clear_optimistic_value(self) -> None:
         """Clear the optimistic value (called after coordinator update)."""
-        cls._optimistic_values.pop((device_id, zone_number), None)
+        self.coordinator.optimistic.clear(self._optimistic_key)
 
-    @classmethod
-    def get_optimistic_value(cls, device_id: str, zone_number: int) -> int | None:
-        """Get the current optimistic value if set and not expired."""
-        entry = cls._optimistic_values.get((device_id, zone_number))
-        if entry is None:
-            return None
-        value, direction, timestamp = entry
-        # Check if expired
-        if time.monotonic() - timestamp > OPTIMISTIC_TIMEOUT:
-            cls._optimistic_values.pop((device_id, zone_number), None)
-            return None
-        return value
+    def get_optimistic_value(self) -> int | None:
+        """Get the current optimistic value, or None if unset or expired."""
+        return self.coordinator.optimistic.get(self._optimistic_key)
 
-    @property
-    def _optimistic_key(self) -> tuple[str, int]:
-        """Get the key for optimistic value lookup."""
-        return (self.coordinator.data.device_id, self.zone_number)
+    @callback
+    def _async_expire_optimistic(self) -> None:
+        """Fall back to the actual value once the optimistic value times out."""
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Zone %d optimistic value timed out, clearing", self.zone_number)
+        self._update_state()
+        self.async_write_ha_state()
 
-    @property
-    def _is_temperature_mode(self) -> bool:
+    def _read_temperature_mode(self, zone: ZoneState) -> bool:
         """Check if zone is in temperature mode (has sensor and temp control enabled).
 
         Checks optimistic mode first (for immediate UI feedback when mode changes),
         then falls back to actual coordinator data.
         """
-        zone = self.coordinator.data.zones[self.zone_number]
         if not zone.has_sensor:
             return False
 
         # Check for optimistic mode from control mode select (for immediate UI sync)
-        optimistic_mode = AirTouch3ZoneControlModeSelect.get_optimistic_mode(
-            self.coordinator.data.device_id, self.zone_number
-        )
+        optimistic_mode = self.coordinator.optimistic.get(self._mode_key)
         if optimistic_mode is not None:
             return optimistic_mode
 
         return zone.temperature_control
 
-    @property
-    def native_value(self) -> float | None:
+    def _update_state(self) -> None:
+        """Cache value, device class, unit and icon from the current mode and zone."""
+        if self._is_temperature_mode:
+            self._attr_device_class = SensorDeviceClass.TEMPERATURE
+            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+            self._attr_icon = "mdi:thermometer"
+        else:
+            self._attr_device_class = None  # No device class for percentage
+            self._attr_native_unit_of_measurement = PERCENTAGE
+            self._attr_icon = "mdi:fan"
+        self._attr_native_value = self._current_value()
+
+    def _current_value(self) -> float | None:
         """Return current setpoint value, preferring optimistic value."""
-        zone = self.coordinator.data.zones[self.zone_number]
-
-        # Check for optimistic value first (get_optimistic_value handles timeout)
-        optimistic = self.get_optimistic_value(*self._optimistic_key)
+        # Check for optimistic value first (expiry timer clears it on timeout)
+        optimistic = self.get_optimistic_value()
         if optimistic is not None:
             return float(optimistic)
 
+        zone = self._cached_zone
+
         # For zones with sensors in temp mode, return setpoint
         if self._is_temperature_mode and zone.setpoint is not None:
             return float(zone.setpoint)
@@ -301,65 +305,26 @@ class AirTouch3ZoneSetpointSensor(CoordinatorEntity[AirTouch3Coordinator], Senso
         return float(zone.damper_percent)
 
     def _handle_coordinator_update(self) -> None:
-        """Handle coordinator update - clear optimistic value if actual has caught up or timed out."""
-        zone = self.coordinator.data.zones[self.zone_number]
-        optimistic_entry = self._optimistic_values.get(self._optimistic_key)
-        if optimistic_entry is not None:
-            optimistic_value, direction, timestamp = optimistic_entry
-            
-            # Check timeout first - always clear if expired
-            if time.monotonic() - timestamp > OPTIMISTIC_TIMEOUT:
-                LOGGER.debug(
-                    "Zone %d optimistic value %d timed out, clearing",
-                    self.zone_number, optimistic_value
-                )
-                self.clear_optimistic_value(*self._optimistic_key)
+        """Handle coordinator update - clear optimistic value if actual has caught up."""
+        zone = self._cached_zone = self.coordinator.data.zones[self.zone_number]
+        self._is_temperature_mode = self._read_temperature_mode(zone)
+        optimistic_value = self.get_optimistic_value()
+        if optimistic_value is not None:
+            direction = self.coordinator.optimistic.direction(self._optimistic_key)
+
+            # Get actual value from coordinator
+            if self._is_temperature_mode:
+                actual = zone.setpoint
             else:
-                # Get actual value from coordinator
-                if self._is_temperature_mode:
-                    actual = zone.setpoint
-                else:
-                    actual = zone.damper_percent
-                
-                if actual is not None:
-                    # Clear if actual has caught up to or exceeded optimistic
-                    # For 'up' direction: clear when actual >= optimistic
-                    # For 'down' direction: clear when actual <= optimistic
-                    if direction == 'up' and actual >= optimistic_value:
-                        self.clear_optimistic_value(*self._optimistic_key)
-                    elif direction == 'down' and actual <= optimistic_value:
-                        self.clear_optimistic_value(*self._optimistic_key)
+                actual = zone.damper_percent
+
+            if actual is not None:
+                # Clear if actual has caught up to or exceeded optimistic
+                # For 'up' direction: clear when actual >= optimistic
+                # For 'down' direction: clear when actual <= optimistic
+                if direction == 'up' and actual >= optimistic_value:
+                    self.clear_optimistic_value()
+                elif direction == 'down' and actual <= optimistic_value:
+                    self.clear_optimistic_value()
+        self._update_state()
         super()._handle_coordinator_update()
-
-    @property
-    def device_class(self) -> SensorDeviceClass | None:
-        """Return device class based on mode."""
-        if self._is_temperature_mode:
-            return SensorDeviceClass.TEMPERATURE
-        return None  # No device class for percentage
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return unit based on mode."""
-        if self._is_temperature_mode:
-            return UnitOfTemperature.CELSIUS
-        return PERCENTAGE
-
-    @property
-    def icon(self) -> str:
-        """Return icon based on control mode."""
-        if self._is_temperature_mode:
-            return "mdi:thermometer"
-        return "mdi:fan"
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self.coordinator.data.device_id}_zone_{self.zone_number}_setpoint"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - zone sub-device."""
-        return get_zone_device_info(self.coordinator, self.zone_number)
-
-
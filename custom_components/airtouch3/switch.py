@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
+from itertools import chain
+import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
@@ -16,7 +18,10 @@ from .const import DOMAIN
 from .coordinator import AirTouch3Coordinator
 from .models import AcState, ZoneState
 
+LOGGER = logging.getLogger(__name__)
+
 # Ignore coordinator updates for this many seconds after a toggle command
+# (the coordinator's OptimisticManager clears the state when the hold ends)
 # Zone switches need less time as damper position is reliable
 # AC power needs longer as the status byte is less reliable
 OPTIMISTIC_HOLD_SECONDS = 5.0
@@ -24,25 +29,34 @@ AC_OPTIMISTIC_HOLD_SECONDS = 10.0
 
 
 def get_zone_device_info(coordinator: AirTouch3Coordinator, zone_number: int) -> DeviceInfo:
-    """Get device info for a zone sub-device."""
-    zone = coordinator.data.zones[zone_number]
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.data.device_id}_zone_{zone_number}")},
-        name=f"AirTouch3 {zone.name}",
-        manufacturer="Polyaire",
-        model="AirTouch 3 Zone",
-        via_device=(DOMAIN, coordinator.data.device_id),
-    )
+    """Get device info for a zone sub-device.
+
+    Built once per zone and shared by all of that zone's entities. The cache
+    lives on the coordinator, so it is rebuilt when the entry reloads.
+    """
+    device_info = coordinator.zone_device_info.get(zone_number)
+    if device_info is None:
+        zone = coordinator.data.zones[zone_number]
+        device_info = coordinator.zone_device_info[zone_number] = DeviceInfo(
+            identifiers={(DOMAIN, f"{coordinator.data.device_id}_zone_{zone_number}")},
+            name=f"AirTouch3 {zone.name}",
+            manufacturer="Polyaire",
+            model="AirTouch 3 Zone",
+            via_device=(DOMAIN, coordinator.data.device_id),
+        )
+    return device_info
 
 
 def get_main_device_info(coordinator: AirTouch3Coordinator) -> DeviceInfo:
-    """Get device info for the main AirTouch 3 device."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, coordinator.data.device_id)},
-        name=f"AirTouch3 {coordinator.data.system_name}",
-        manufacturer="Polyaire",
-        model="AirTouch 3",
-    )
+    """Get device info for the main AirTouch 3 device (cached on the coordinator)."""
+    if coordinator.main_device_info is None:
+        coordinator.main_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.data.device_id)},
+            name=f"AirTouch3 {coordinator.data.system_name}",
+            manufacturer="Polyaire",
+            model="AirTouch 3",
+        )
+    return coordinator.main_device_info
 
 
 async def async_setup_entry(
@@ -50,17 +64,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up switch entities."""
     coordinator: AirTouch3Coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[SwitchEntity] = []
-
-    # Zone switches
-    for zone in coordinator.data.zones:
-        entities.append(AirTouch3ZoneSwitch(coordinator, zone.zone_number))
-
-    # AC power switches
-    for ac in coordinator.data.ac_units:
-        entities.append(AirTouch3AcPowerSwitch(coordinator, ac.ac_number))
-
-    async_add_entities(entities)
+    async_add_entities(
+        chain(
+            # Zone switches
+            (AirTouch3ZoneSwitch(coordinator, zone.zone_number) for zone in coordinator.data.zones),
+            # AC power switches
+            (AirTouch3AcPowerSwitch(coordinator, ac.ac_number) for ac in coordinator.data.ac_units),
+        )
+    )
 
 
 class AirTouch3ZoneSwitch(CoordinatorEntity[AirTouch3Coordinator], SwitchEntity):
@@ -73,75 +84,120 @@ class AirTouch3ZoneSwitch(CoordinatorEntity[AirTouch3Coordinator], SwitchEntity)
         """Initialize zone switch."""
         super().__init__(coordinator)
         self.zone_number = zone_number
-        self._optimistic_state: bool | None = None
-        self._optimistic_until: float = 0.0
+        self._attr_unique_id = f"{coordinator.data.device_id}_zone_{zone_number}_power"
+        self._attr_device_info = get_zone_device_info(coordinator, zone_number)
+        # Fixed-key attributes dict, updated in place on each coordinator update
+        self._attr_extra_state_attributes: dict[str, Any] = {
+            "damper_percent": 0,
+            "is_spill": False,
+            "active_program": None,
+            "sensor_source": None,
+        }
+        # Zone snapshot, refreshed once per coordinator update
+        self._cached_zone = coordinator.data.zones[zone_number]
+        self._update_attrs(self._cached_zone)
+        self._optimistic_key = ("zone_power", zone_number)
+        # (available, is_on, *attribute values) as of the last state write
+        self._last_written: tuple[Any, ...] | None = None
 
     @property
     def _zone_state(self) -> ZoneState:
-        return self.coordinator.data.zones[self.zone_number]
+        return self._cached_zone
 
     @property
     def is_on(self) -> bool:
         """Return True if zone is on."""
-        # Use optimistic state if within hold period
-        if self._optimistic_state is not None and time.monotonic() < self._optimistic_until:
-            return self._optimistic_state
-        # Clear expired optimistic state
-        self._optimistic_state = None
+        # Use optimistic state during the hold period (cleared by timer)
+        optimistic = self.coordinator.optimistic.get(self._optimistic_key)
+        if optimistic is not None:
+            return optimistic
         return self._zone_state.is_on
 
+    @callback
+    def _set_optimistic_state(self, state: bool) -> None:
+        """Hold an optimistic state, writing the actual state when the hold ends."""
+        self.coordinator.optimistic.set(
+            self._optimistic_key, state, OPTIMISTIC_HOLD_SECONDS, self._async_write_if_changed
+        )
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state only if it differs from the last written state."""
+        zone = self._zone_state
+        current = (
+            self.available,
+            self.is_on,
+            zone.damper_percent,
+            zone.is_spill,
+            zone.active_program,
+            zone.sensor_source,
+        )
+        if current != self._last_written:
+            self._last_written = current
+            self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any optimistic state on removal."""
+        self.coordinator.optimistic.clear(self._optimistic_key)
+        await super().async_will_remove_from_hass()
+
+    def _update_attrs(self, zone: ZoneState) -> None:
+        """Refresh the extra state attribute values from zone state."""
+        attrs = self._attr_extra_state_attributes
+        attrs["damper_percent"] = zone.damper_percent
+        attrs["is_spill"] = zone.is_spill
+        attrs["active_program"] = zone.active_program
+        attrs["sensor_source"] = zone.sensor_source
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from coordinator."""
-        # If optimistic hold expired, or coordinator confirms our expected state, clear optimistic
-        if self._optimistic_state is not None:
-            if time.monotonic() >= self._optimistic_until:
-                self._optimistic_state = None
-            elif self._zone_state.is_on == self._optimistic_state:
-                # Coordinator now agrees, clear optimistic early
-                self._optimistic_state = None
-        super()._handle_coordinator_update()
+        zone = self._cached_zone = self.coordinator.data.zones[self.zone_number]
+        self._update_attrs(zone)
+        # If coordinator confirms our expected state, clear optimistic early
+        if zone.is_on == self.coordinator.optimistic.get(self._optimistic_key):
+            self.coordinator.optimistic.clear(self._optimistic_key)
+        # Most polls change nothing for an idle zone, so skip those writes
+        self._async_write_if_changed()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn zone on, handling toggle protocol."""
-        if not self._zone_state.is_on:
-            # Set optimistic state before sending command
-            self._optimistic_state = True
-            self._optimistic_until = time.monotonic() + OPTIMISTIC_HOLD_SECONDS
-            self.async_write_ha_state()
-            await self.coordinator.client.zone_toggle(self.zone_number)
-            await self.coordinator.async_request_refresh()
+        self._async_set(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn zone off, handling toggle protocol."""
-        if self._zone_state.is_on:
-            # Set optimistic state before sending command
-            self._optimistic_state = False
-            self._optimistic_until = time.monotonic() + OPTIMISTIC_HOLD_SECONDS
-            self.async_write_ha_state()
-            await self.coordinator.client.zone_toggle(self.zone_number)
-            await self.coordinator.async_request_refresh()
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Additional attributes."""
-        zone = self._zone_state
-        return {
-            "damper_percent": zone.damper_percent,
-            "is_spill": zone.is_spill,
-            "active_program": zone.active_program,
-            "sensor_source": zone.sensor_source,
-        }
+        self._async_set(False)
 
-    @property
-    def unique_id(self) -> str:
-        """Unique ID for zone."""
-        return f"{self.coordinator.data.device_id}_zone_{self.zone_number}_power"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - zone sub-device."""
-        return get_zone_device_info(self.coordinator, self.zone_number)
+    @callback
+    def _async_set(self, target: bool) -> None:
+        """Toggle the zone if it isn't already in the target state."""
+        # Compare against is_on (optimistic-aware) so a repeat command during
+        # the hold doesn't re-toggle because of a stale poll
+        if self.is_on == target:
+            return
+        # Set optimistic state before sending command
+        self._set_optimistic_state(target)
+        self._async_write_if_changed()
+        # Tied to the config entry so unload cancels a toggle still queued on
+        # the client lock instead of letting it reconnect after shutdown
+        self.coordinator.config_entry.async_create_background_task(
+            self.hass, self._async_send_toggle(), f"airtouch3_zone_{self.zone_number}_toggle"
+        )
+
+    async def _async_send_toggle(self) -> None:
+        """Send the zone toggle in the background, then request a refresh.
+
+        The optimistic state is already written, so the service call
+        doesn't wait on the device. Failures are logged here; the refresh
+        (or hold expiry) brings the state back in line. The coordinator's
+        debouncer folds refreshes from a burst of toggles into one poll.
+        """
+        try:
+            if not await self.coordinator.client.zone_toggle(self.zone_number):
+                LOGGER.warning("Zone %d toggle command failed", self.zone_number)
+        except (asyncio.TimeoutError, OSError) as err:
+            LOGGER.warning("Zone %d toggle command failed: %s", self.zone_number, err)
+        await self.coordinator.async_request_refresh()
 
 
 class AirTouch3AcPowerSwitch(CoordinatorEntity[AirTouch3Coordinator], SwitchEntity):
@@ -154,10 +210,13 @@ class AirTouch3AcPowerSwitch(CoordinatorEntity[AirTouch3Coordinator], SwitchEnti
         """Initialize AC power switch."""
         super().__init__(coordinator)
         self.ac_number = ac_number
+        self._attr_unique_id = f"{coordinator.data.device_id}_ac_{ac_number}_power"
+        self._attr_device_info = get_main_device_info(coordinator)
         ac_name = coordinator.data.ac_units[ac_number].name
         self._attr_name = f"{ac_name} Power"
-        self._optimistic_state: bool | None = None
-        self._optimistic_until: float = 0.0
+        self._optimistic_key = ("ac_power", ac_number)
+        # (available, is_on) as of the last state write
+        self._last_written: tuple[bool, bool] | None = None
 
     @property
     def _ac_state(self) -> AcState:
@@ -166,29 +225,45 @@ class AirTouch3AcPowerSwitch(CoordinatorEntity[AirTouch3Coordinator], SwitchEnti
     @property
     def is_on(self) -> bool:
         """Return True if AC is on."""
-        if self._optimistic_state is not None and time.monotonic() < self._optimistic_until:
-            return self._optimistic_state
-        self._optimistic_state = None
+        # Only the expiry timer clears optimistic state
+        # Don't clear early on match - protocol data can bounce
+        optimistic = self.coordinator.optimistic.get(self._optimistic_key)
+        if optimistic is not None:
+            return optimistic
         return self._ac_state.power_on
 
+    @callback
+    def _set_optimistic_state(self, state: bool) -> None:
+        """Hold an optimistic state, writing the actual state when the hold ends."""
+        self.coordinator.optimistic.set(
+            self._optimistic_key, state, AC_OPTIMISTIC_HOLD_SECONDS, self._async_write_if_changed
+        )
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state only if it differs from the last written state."""
+        current = (self.available, self.is_on)
+        if current != self._last_written:
+            self._last_written = current
+            self.async_write_ha_state()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from coordinator."""
-        # Only clear optimistic state when hold period expires
-        # Don't clear early on match - protocol data can bounce
-        if self._optimistic_state is not None:
-            if time.monotonic() >= self._optimistic_until:
-                self._optimistic_state = None
-        super()._handle_coordinator_update()
+        self._async_write_if_changed()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any optimistic state on removal."""
+        self.coordinator.optimistic.clear(self._optimistic_key)
+        await super().async_will_remove_from_hass()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn AC on."""
         # Always send toggle if user wants ON and we're showing OFF
         # Don't trust _ac_state.power_on as protocol data can be unreliable
         if not self.is_on:
-            self._optimistic_state = True
-            self._optimistic_until = time.monotonic() + AC_OPTIMISTIC_HOLD_SECONDS
-            self.async_write_ha_state()
+            self._set_optimistic_state(True)
+            self._async_write_if_changed()
             await self.coordinator.client.ac_power_toggle(self.ac_number)
             await self.coordinator.async_request_refresh()
 
@@ -197,18 +272,7 @@ class AirTouch3AcPowerSwitch(CoordinatorEntity[AirTouch3Coordinator], SwitchEnti
         # Always send toggle if user wants OFF and we're showing ON
         # Don't trust _ac_state.power_on as protocol data can be unreliable
         if self.is_on:
-            self._optimistic_state = False
-            self._optimistic_until = time.monotonic() + AC_OPTIMISTIC_HOLD_SECONDS
-            self.async_write_ha_state()
+            self._set_optimistic_state(False)
+            self._async_write_if_changed()
             await self.coordinator.client.ac_power_toggle(self.ac_number)
             await self.coordinator.async_request_refresh()
-
-    @property
-    def unique_id(self) -> str:
-        """Unique ID for AC power switch."""
-        return f"{self.coordinator.data.device_id}_ac_{self.ac_number}_power"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Device registry info - main device."""
-        return get_main_device_info(self.coordinator)